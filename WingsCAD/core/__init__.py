@@ -1,11 +1,31 @@
 # core/__init__.py
+#
+# Alt modüller (ve numba) ilk erişimde import ediliyor: "from core import
+# generate_naca5_full" sadece naca5'i (+ _common) yüklüyor; core.naca4 gibi
+# doğrudan import'lar diğer aileleri hiç yüklemiyor.
 
-from .naca4 import generate_naca4_full
-from .naca5 import generate_naca5_full
-from .naca6 import generate_naca6_full
+import importlib
 
-__all__ = [
-    "generate_naca4_full",
-    "generate_naca5_full",
-    "generate_naca6_full",
-]
+# public name -> tanımlandığı alt modül
+_LAZY = {
+    "HAVE_NUMBA": "._common",
+    "generate_naca4_full": ".naca4",
+    "generate_naca4_batch": ".naca4",
+    "generate_naca5_full": ".naca5",
+    "generate_naca6_full": ".naca6",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    mod_name = _LAZY.get(name)
+    if mod_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(mod_name, __name__), name)
+    globals()[name] = value   # sonraki erişimler __getattr__'a düşmüyor
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
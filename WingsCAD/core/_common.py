@@ -0,0 +1,191 @@
+# core/_common.py
+
+from functools import lru_cache, wraps
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+except ImportError:  # numba opsiyonel; yoksa NumPy yolu kullanılır
+    njit = vectorize = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _digits(s: str):
+    """
+    ASCII digit string -> list of ints (ord(ch) - 48), rakam olmayan bir
+    karakter varsa None. int()/isdigit() yerine tek geçişte.
+    """
+    d = [ord(ch) - 48 for ch in s]
+    if d and (min(d) < 0 or max(d) > 9):
+        return None
+    return d
+
+
+def _cached_result(maxsize: int = 256):
+    """
+    LRU cache decorator for generate_naca*_full style functions that return
+    (array, ..., metrics_dict).
+
+    Aynı girdilerle tekrar çağrı (UI redraw vb.) sadece dict lookup.
+    Cache'teki diziler paylaşıldığı için read-only yapılıyor; değiştirmek
+    isteyen .copy() almalı. metrics dict her çağrıda kopyalanıyor.
+    """
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached(*args, **kwargs):
+            *arrays, metrics = func(*args, **kwargs)
+            for arr in arrays:
+                arr.flags.writeable = False
+            return (*arrays, metrics)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            *arrays, metrics = cached(*args, **kwargs)
+            return (*arrays, dict(metrics))
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+def _thickness(t: float, x: np.ndarray, sqrt_x: np.ndarray) -> np.ndarray:
+    """
+    Standard NACA 00xx half-thickness distribution (4/5/6 ortak).
+
+    Polinom Horner formunda ve tek bir buffer üzerinde yerinde
+    hesaplanıyor; x**k ara dizileri oluşmuyor.
+    """
+    yt = x * -0.1015
+    yt += 0.2843
+    yt *= x
+    yt -= 0.3516
+    yt *= x
+    yt -= 0.1260
+    yt *= x
+    yt += 0.2969 * sqrt_x
+    yt *= 5 * t
+    return yt
+
+
+@lru_cache(maxsize=32)
+def _x_grid(spacing: str, n: int, dtype=np.float64):
+    """
+    Base x distribution (0..1) for the given spacing, cached per
+    (spacing, n, dtype) together with the powers used by the camber lines
+    and the unit-thickness (t = 1) profile. Grid float64'te hesaplanıp
+    sonra dtype'a çevriliyor.
+
+    Kalınlık t ile lineer olduğundan yt = t * yt_unit; sqrt(x) ve polinom
+    her (spacing, n) için sadece bir kez hesaplanıyor.
+
+    Dönen diziler read-only: cache'teki veriyi bozmamak için yerinde
+    değiştirilmemeli.
+
+    Returns:
+        x, x2, x3, yt_unit
+    """
+    if spacing == "cosine":
+        beta = np.linspace(0.0, np.pi, n)
+        x = (1.0 - np.cos(beta)) / 2.0
+    elif spacing == "linear":
+        x = np.linspace(0.0, 1.0, n)
+    else:
+        raise ValueError("spacing must be 'cosine' or 'linear'.")
+
+    yt_unit = _thickness(1.0, x, np.sqrt(x)).astype(dtype, copy=False)
+    x = x.astype(dtype, copy=False)
+    x2 = x * x
+    x3 = x2 * x
+
+    grid = (x, x2, x3, yt_unit)
+    for arr in grid:
+        arr.flags.writeable = False
+    return grid
+
+
+def _offset_surfaces(x: np.ndarray,
+                     yc: np.ndarray,
+                     yt: np.ndarray,
+                     dyc_dx: np.ndarray):
+    """
+    Upper / lower surfaces: camber line'a dik ±yt ofseti.
+
+    sin(atan(y'_c)) = y'_c / sqrt(1 + y'_c^2), cos(atan(y'_c)) = 1 / sqrt(1 + y'_c^2).
+    yt*sin ve yt*cos bir kez, ara buffer'lar yerinde yeniden kullanılarak
+    hesaplanıyor. Broadcasting ile (B, N) batch dizileri için de geçerli.
+
+    Returns:
+        xu, yu, xl, yl
+    """
+    cos_t = dyc_dx * dyc_dx
+    cos_t += 1.0
+    np.sqrt(cos_t, out=cos_t)
+    np.reciprocal(cos_t, out=cos_t)
+
+    ts = dyc_dx * cos_t   # sin_t
+    ts *= yt              # yt * sin_t
+    cos_t *= yt           # yt * cos_t (yerinde)
+
+    return x - ts, yc + cos_t, x + ts, yc - cos_t
+
+
+def _close_loop(xu: np.ndarray,
+                yu: np.ndarray,
+                xl: np.ndarray,
+                yl: np.ndarray,
+                c: float):
+    """
+    Closed loop coordinates (upper TE->LE, lower LE->TE), x scaled by chord.
+
+    Çıktı önceden ayrılıyor; kopyalama ve chord ölçeklemesi tek geçişte
+    (np.multiply(..., out=...)) yapılıyor. Son eksen boyunca çalışır,
+    yani (B, N) batch dizileri için de geçerli.
+
+    Ters slice'lar (xu[..., ::-1]) view olarak dönmüyor, C-contiguous
+    hedefe yazılıyor; np.dot / ufunc'lar SIMD yolunu kullanabiliyor.
+    """
+    n = xu.shape[-1]
+    shape = xu.shape[:-1] + (2 * n - 1,)
+    x_loop = np.empty(shape, dtype=xu.dtype, order="C")
+    y_loop = np.empty(shape, dtype=xu.dtype, order="C")
+
+    np.multiply(xu[..., ::-1], c, out=x_loop[..., :n])
+    np.multiply(xl[..., 1:], c, out=x_loop[..., n:])
+    y_loop[..., :n] = yu[..., ::-1]
+    y_loop[..., n:] = yl[..., 1:]
+
+    assert x_loop.flags.c_contiguous and x_loop.flags.aligned
+    assert y_loop.flags.c_contiguous and y_loop.flags.aligned
+    return x_loop, y_loop
+
+
+def _shoelace(x: np.ndarray, y: np.ndarray) -> float:
+    """
+    Polygon area of a closed loop (shoelace formula).
+
+    np.roll kopyaları yerine kaydırılmış slice'lar + kapanış terimi;
+    toplam her zaman float64'te yapılıyor.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # interior cross terms + wrap (last -> first)
+    s = np.dot(x[:-1], y[1:]) - np.dot(y[:-1], x[1:])
+    s += x[-1] * y[0] - y[-1] * x[0]
+    return 0.5 * abs(float(s))
+
+
+def _symmetric_geometry(x: np.ndarray, yt: np.ndarray, c: float):
+    """
+    Simetrik profil (camber yok): yüzeyler doğrudan x, ±yt; trig/normal
+    hesabı gerekmiyor.
+
+    Returns (generate_geometry ile aynı sıra):
+        x_loop, y_loop, x_c, yc, x_raw, yt
+    """
+    x_loop, y_loop = _close_loop(x, yt, x, -yt, c)
+    yc = np.zeros_like(x)
+    return x_loop, y_loop, x * c, yc, x, yt
@@ -0,0 +1,70 @@
+# core/_passthrough.py
+
+from typing import NamedTuple
+import numpy as np
+from .naca4 import generate_naca4_full  # 4-digit geometrisini kullanacağız
+
+
+class NACAPassthroughParams(NamedTuple):
+    code: str      # e.g. "72412" (seri etiketi + 4-digit kod)
+    base4: str     # 4-digit'e dönüştürdüğümüz kısım
+    chord: float = 1.0
+
+
+def parse_passthrough(lead: str, code: str, chord: float = 1.0) -> NACAPassthroughParams:
+    """
+    NACA 7- ve 8-seri için ortak parser.
+
+    Gerçek analitik tanım şu an uygulanmıyor: baştaki rakam (lead) sadece
+    bir 'etiket', geri kalan 4 hane NACA 4-digit kodu gibi yorumlanıyor.
+
+    Örnek:
+        lead="7", "72412" -> 4-digit eşleniği: 2412
+    """
+    s = code.strip()
+    if len(s) < 4 or not s.isdigit():
+        raise ValueError(
+            f"NACA {lead}-series: en az 4 haneli numeric kod bekleniyor, örn. '{lead}412'."
+        )
+
+    if s[0] != lead:
+        raise ValueError(f"NACA {lead}-series kodu {lead} ile başlamalı.")
+
+    base4 = s[1:]           # ilk rakamdan sonrası 4-digit gibi
+    if len(base4) != 4:
+        raise ValueError(
+            f"Şimdilik '{lead}' + 4-digit formatı destekleniyor, örn. {lead}412, {lead}309 vb."
+        )
+
+    return NACAPassthroughParams(code=s, base4=base4, chord=chord)
+
+
+def generate_naca_passthrough(lead: str,
+                              code: str,
+                              chord: float = 1.0,
+                              n_points: int = 200,
+                              spacing: str = "cosine",
+                              dtype=np.float32):
+    """
+    '<lead>' + 4-digit kodları için geometri (NACA 7/8 placeholder).
+
+    Returns:
+        x_loop, y_loop, x_c, yc, metrics_dict
+    """
+    params = parse_passthrough(lead, code, chord=chord)
+    x_loop, y_loop, x_c, yc, metrics4 = generate_naca4_full(
+        params.base4,
+        chord=chord,
+        n_points=n_points,
+        spacing=spacing,
+        dtype=dtype,
+    )
+
+    # seri etiketiyle yeni metrics üretelim
+    metrics = dict(metrics4)
+    metrics["code"] = params.code
+    metrics["note"] = (
+        f"Geometry generated using NACA 4-digit equivalent of {lead}-series code."
+    )
+
+    return x_loop, y_loop, x_c, yc, metrics
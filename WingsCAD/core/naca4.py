@@ -1,11 +1,17 @@
 # core/naca4.py
 
-from dataclasses import dataclass
+from typing import NamedTuple
+from functools import lru_cache
+import math
 import numpy as np
 
+from ._common import (
+    _digits, _x_grid, _offset_surfaces, _close_loop, _shoelace, _symmetric_geometry,
+    _cached_result, njit, vectorize,
+)
 
-@dataclass
-class NACA4Params:
+
+class NACA4Params(NamedTuple):
     code: str        # e.g. "2412"
     m: float         # max camber (fraction of chord)
     p: float         # location of max camber (fraction of chord)
@@ -18,19 +24,111 @@ def parse_naca4(code: str, chord: float = 1.0) -> NACA4Params:
     Parse a NACA 4-digit code like '2412' into geometric parameters.
     """
     code = code.strip()
-    if len(code) != 4 or not code.isdigit():
+    d = _digits(code)
+    if d is None or len(d) != 4:
         raise ValueError("NACA 4-digit code must be 4 digits, e.g. '2412'.")
 
-    m = int(code[0]) / 100.0      # max camber
-    p = int(code[1]) / 10.0       # location of max camber
-    t = int(code[2:]) / 100.0     # thickness
+    m = d[0] / 100.0                  # max camber
+    p = d[1] / 10.0                   # location of max camber
+    t = (d[2] * 10 + d[3]) / 100.0    # thickness
 
     return NACA4Params(code=code, m=m, p=p, t=t, chord=chord)
 
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _naca4_core(m, p, t, x, yt_unit):
+        """
+        Numba kernel: thickness, camber ve yüzeyler tek bir döngüde.
+        Sadece kamburlu profiller için (p > 0); chord ile ölçekleme
+        çağıran tarafta yapılıyor.
+        """
+        n = x.size
+        yt = np.empty_like(x)
+        yc = np.empty_like(x)
+        xu = np.empty_like(x)
+        yu = np.empty_like(x)
+        xl = np.empty_like(x)
+        yl = np.empty_like(x)
+
+        for i in range(n):
+            xi = x[i]
+            x2 = xi * xi   # pow() yerine çarpım
+            yt_i = t * yt_unit[i]
+
+            if xi < p:
+                yc_i = m / (p * p) * (2.0 * p * xi - x2)
+                dyc = 2.0 * m / (p * p) * (p - xi)
+            else:
+                q2 = (1.0 - p) * (1.0 - p)
+                yc_i = m / q2 * ((1.0 - 2.0 * p) + 2.0 * p * xi - x2)
+                dyc = 2.0 * m / q2 * (p - xi)
+
+            # sin/cos(atan(y'_c)) trig'siz
+            cos_t = 1.0 / math.sqrt(dyc * dyc + 1.0)
+            sin_t = dyc * cos_t
+
+            yt[i] = yt_i
+            yc[i] = yc_i
+            xu[i] = xi - yt_i * sin_t
+            yu[i] = yc_i + yt_i * cos_t
+            xl[i] = xi + yt_i * sin_t
+            yl[i] = yc_i - yt_i * cos_t
+
+        return xu, yu, xl, yl, yc, yt
+else:
+    _naca4_core = None
+
+
+# Not: SIMD döngüde iki dal da hesaplanabildiği için p == 0 satırlarında
+# bölme güvenli bir q ile yapılıp sonuç sonradan sıfırlanıyor (0/0 yok).
+
+def _naca4_camber(x, m, p):
+    """Scalar camber line y_c(x) (p == 0 -> symmetric)."""
+    q = p if p > 0.0 else 0.5
+    if x < q:
+        yc = m * (2.0 * q * x - x * x) / (q * q)
+    else:
+        yc = m * ((1.0 - 2.0 * q) + 2.0 * q * x - x * x) / ((1.0 - q) * (1.0 - q))
+    return yc if p > 0.0 else 0.0
+
+
+def _naca4_camber_slope(x, m, p):
+    """Scalar camber slope dy_c/dx (p == 0 -> symmetric)."""
+    q = p if p > 0.0 else 0.5
+    if x < q:
+        dyc = 2.0 * m * (q - x) / (q * q)
+    else:
+        dyc = 2.0 * m * (q - x) / ((1.0 - q) * (1.0 - q))
+    return dyc if p > 0.0 else 0.0
+
+
+_CAMBER_SIGS = [
+    "float32(float32, float32, float32)",
+    "float64(float64, float64, float64)",
+]
+
+
+@lru_cache(maxsize=None)
+def _camber_ufuncs():
+    """
+    numba.vectorize ile (yc, dyc/dx) ufunc'ları; broadcasting ile (B, N)
+    batch dizilerinde çok çekirdekli çalışıyor. Import süresini uzatmamak
+    için ilk batch çağrısında derleniyor. numba yoksa None.
+    """
+    if vectorize is None:
+        return None
+    opts = dict(target="parallel", fastmath=True, cache=True)
+    return (
+        vectorize(_CAMBER_SIGS, **opts)(_naca4_camber),
+        vectorize(_CAMBER_SIGS, **opts)(_naca4_camber_slope),
+    )
+
+
 def generate_geometry(params: NACA4Params,
                       n_points: int = 200,
-                      spacing: str = "cosine"):
+                      spacing: str = "cosine",
+                      dtype=np.float32):
     """
     Generate NACA 4-digit airfoil geometry.
 
@@ -38,58 +136,45 @@ def generate_geometry(params: NACA4Params,
         x_loop, y_loop : closed loop coordinates (upper TE->LE, lower LE->TE)
         x_c, y_c       : camber line coordinates
         x_raw, yt      : base x and thickness distribution (for analysis)
+
+    Arrays are float32 by default (plot/CAD için yeterli); pass
+    dtype=np.float64 for precision-sensitive downstream use.
     """
     m, p, t, c = params.m, params.p, params.t, params.chord
 
-    # ---- x dağılımı ----
-    if spacing == "cosine":
-        beta = np.linspace(0.0, np.pi, n_points)
-        x = (1.0 - np.cos(beta)) / 2.0
-    elif spacing == "linear":
-        x = np.linspace(0.0, 1.0, n_points)
-    else:
-        raise ValueError("spacing must be 'cosine' or 'linear'.")
-
-    # ---- thickness distribution (standard NACA 4 form) ----
-    yt = 5 * t * (
-        0.2969 * np.sqrt(x)
-        - 0.1260 * x
-        - 0.3516 * x**2
-        + 0.2843 * x**3
-        - 0.1015 * x**4
-    )
+    # ---- x dağılımı (cache'li, read-only) ----
+    x, x2, x3, yt_unit = _x_grid(spacing, n_points, dtype)
 
-    # ---- camber line & derivative ----
-    yc = np.zeros_like(x)
-    dyc_dx = np.zeros_like(x)
+    if p == 0 or m == 0:
+        # symmetric NACA 00xx: camber/normal hesabı yok
+        yt = t * yt_unit
+        return _symmetric_geometry(x, yt, c)
 
-    if p == 0:
-        # symmetric NACA 00xx
-        yc[:] = 0.0
-        dyc_dx[:] = 0.0
+    if _naca4_core is not None:
+        # numba varsa tüm nümerik gövde native kod olarak çalışıyor
+        xu, yu, xl, yl, yc, yt = _naca4_core(m, p, t, x, yt_unit)
     else:
-        for i, xi in enumerate(x):
-            if xi < p:
-                yc[i] = m / p**2 * (2 * p * xi - xi**2)
-                dyc_dx[i] = 2 * m / p**2 * (p - xi)
-            else:
-                yc[i] = m / (1 - p)**2 * ((1 - 2 * p) + 2 * p * xi - xi**2)
-                dyc_dx[i] = 2 * m / (1 - p)**2 * (p - xi)
+        # ---- thickness distribution (standard NACA 4 form) ----
+        yt = t * yt_unit
 
-    theta = np.arctan(dyc_dx)
+        # ---- camber line & derivative ----
+        # ön (x < p) ve arka kısım tek seferde, maske ile
+        fwd = x < p
+        inv_p2 = 1.0 / (p * p)
+        inv_q2 = 1.0 / ((1 - p) * (1 - p))
+        yc = np.where(
+            fwd,
+            m * inv_p2 * (2 * p * x - x2),
+            m * inv_q2 * ((1 - 2 * p) + 2 * p * x - x2),
+        )
+        ftype = x.dtype.type
+        dyc_dx = 2 * m * (p - x) * np.where(fwd, ftype(inv_p2), ftype(inv_q2))
 
-    # ---- upper / lower surfaces ----
-    xu = x - yt * np.sin(theta)
-    yu = yc + yt * np.cos(theta)
-    xl = x + yt * np.sin(theta)
-    yl = yc - yt * np.cos(theta)
+        # ---- upper / lower surfaces ----
+        xu, yu, xl, yl = _offset_surfaces(x, yc, yt, dyc_dx)
 
-    # closed loop: upper TE->LE, lower LE->TE
-    x_loop = np.concatenate([xu[::-1], xl[1:]])
-    y_loop = np.concatenate([yu[::-1], yl[1:]])
-
-    # scale by chord
-    x_loop *= c
+    # closed loop: upper TE->LE, lower LE->TE (x scaled by chord)
+    x_loop, y_loop = _close_loop(xu, yu, xl, yl, c)
     x_c = x * c  # camber line x
 
     return x_loop, y_loop, x_c, yc, x, yt
@@ -106,14 +191,13 @@ def compute_metrics(params: NACA4Params,
     Returns a dict with useful scalars.
     """
     # max thickness (absolute)
-    max_thickness = np.max(2 * yt) * params.chord  # upper-lower thickness
+    max_thickness = float(np.max(2 * yt)) * params.chord  # upper-lower thickness
 
     # max camber (absolute)
-    max_camber = np.max(np.abs(yc)) * params.chord
+    max_camber = float(np.max(np.abs(yc))) * params.chord
 
     # area (shoelace formula), chord-normalized
-    area = 0.5 * np.abs(np.dot(x_loop, np.roll(y_loop, -1)) -
-                        np.dot(y_loop, np.roll(x_loop, -1)))
+    area = _shoelace(x_loop, y_loop)
 
     # approximate leading-edge radius (classical NACA formula)
     # r_le = 1.1019 * t^2 * c
@@ -132,13 +216,17 @@ def compute_metrics(params: NACA4Params,
     }
 
 
+@_cached_result()
 def generate_naca4_full(code: str,
                         chord: float = 1.0,
                         n_points: int = 200,
-                        spacing: str = "cosine"):
+                        spacing: str = "cosine",
+                        dtype=np.float32):
     """
     Convenience: tek çağrıda hem geometriyi hem metrikleri döndürür.
 
+    Results are LRU-cached; returned arrays are read-only (.copy() if needed).
+
     Returns:
         x_loop, y_loop, x_c, yc, metrics_dict
     """
@@ -147,6 +235,70 @@ def generate_naca4_full(code: str,
         params,
         n_points=n_points,
         spacing=spacing,
+        dtype=dtype,
     )
     metrics = compute_metrics(params, x_loop, y_loop, x_raw, yc, yt)
     return x_loop, y_loop, x_c, yc, metrics
+
+
+def generate_naca4_batch(codes,
+                         chord: float = 1.0,
+                         n_points: int = 200,
+                         spacing: str = "cosine",
+                         dtype=np.float32):
+    """
+    Batched NACA 4-digit geometry: B kod, ortak x grid'e karşı tek bir
+    2-D NumPy ifadesiyle üretiliyor (kod başına Python döngüsü yok).
+
+    Returns dict:
+        x_loop, y_loop : (B, 2N-1) closed loops (upper TE->LE, lower LE->TE)
+        x_c            : (N,) camber line x, tüm satırlar için ortak
+        yc, yt         : (B, N) camber line and thickness distribution
+        codes, m, p, t : parsed codes and (B,) parameter arrays
+    """
+    params = [parse_naca4(code, chord=chord) for code in codes]
+    m = np.array([pr.m for pr in params], dtype=dtype)[:, None]
+    p = np.array([pr.p for pr in params], dtype=dtype)[:, None]
+    t = np.array([pr.t for pr in params], dtype=dtype)[:, None]
+
+    x, x2, x3, yt_unit = _x_grid(spacing, n_points, dtype)
+
+    # kalınlık t ile lineer: (B, 1) * (N,) -> (B, N)
+    yt = t * yt_unit
+
+    ufuncs = _camber_ufuncs()
+    if ufuncs is not None:
+        camber, camber_slope = ufuncs
+        yc = camber(x, m, p)              # (B, N), broadcast
+        dyc_dx = camber_slope(x, m, p)
+    else:
+        # p == 0 satırları simetrik (yc = 0); bölme için p'yi güvenli değere çek
+        cambered = p > 0
+        ftype = x.dtype.type
+        p_s = np.where(cambered, p, ftype(0.5))
+        m_s = np.where(cambered, m, ftype(0.0))
+        inv_p2 = 1.0 / (p_s * p_s)
+        inv_q2 = 1.0 / ((1 - p_s) * (1 - p_s))
+
+        fwd = x < p_s   # (B, N)
+        yc = m_s * np.where(
+            fwd,
+            inv_p2 * (2 * p_s * x - x2),
+            inv_q2 * ((1 - 2 * p_s) + 2 * p_s * x - x2),
+        )
+        dyc_dx = 2 * m_s * (p_s - x) * np.where(fwd, inv_p2, inv_q2)
+
+    xu, yu, xl, yl = _offset_surfaces(x, yc, yt, dyc_dx)
+    x_loop, y_loop = _close_loop(xu, yu, xl, yl, chord)
+
+    return {
+        "codes": [pr.code for pr in params],
+        "m": m[:, 0],
+        "p": p[:, 0],
+        "t": t[:, 0],
+        "x_loop": x_loop,
+        "y_loop": y_loop,
+        "x_c": x * chord,
+        "yc": yc,
+        "yt": yt,
+    }
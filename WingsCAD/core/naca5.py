@@ -1,12 +1,16 @@
 # core/naca5.py
 
-from dataclasses import dataclass
+from typing import NamedTuple
+from functools import lru_cache
 import numpy as np
 import math
 
+from ._common import (
+    _digits, _x_grid, _offset_surfaces, _close_loop, _shoelace, _cached_result, njit,
+)
 
-@dataclass
-class NACA5Params:
+
+class NACA5Params(NamedTuple):
     code: str        # e.g. "23012"
     L: int           # camber parameter
     P: int           # max camber position parameter
@@ -21,13 +25,12 @@ def parse_naca5(code: str, chord: float = 1.0) -> NACA5Params:
     Format: LPQTT (L,P,Q,T,T all digits).
     """
     code = code.strip()
-    if len(code) != 5 or not code.isdigit():
+    d = _digits(code)
+    if d is None or len(d) != 5:
         raise ValueError("NACA 5-digit code must be 5 digits, e.g. '23012'.")
 
-    L = int(code[0])
-    P = int(code[1])
-    Q = int(code[2])
-    t = int(code[3:]) / 100.0
+    L, P, Q = d[0], d[1], d[2]
+    t = (d[3] * 10 + d[4]) / 100.0
 
     if Q not in (0, 1):
         raise ValueError("Third digit (Q) must be 0 (standard) or 1 (reflex).")
@@ -35,38 +38,114 @@ def parse_naca5(code: str, chord: float = 1.0) -> NACA5Params:
     return NACA5Params(code=code, L=L, P=P, Q=Q, t=t, chord=chord)
 
 
-def _compute_r_standard(xmc: float, tol: float = 1e-6, max_iter: int = 1000) -> float:
+def _compute_r_standard(xmc: float, tol: float = 1e-6, max_iter: int = 50) -> float:
     """
     Solve x_mc = r * (1 - sqrt(r/3)) for r (standard, non-reflex case).
-    Fixed point iteration as in ITU/Abbott. :contentReference[oaicite:1]{index=1}
+    Newton-Raphson on f(r) = r * (1 - sqrt(r/3)) - x_mc (ITU/Abbott denklemi).
+
+    x_mc = 0 (P = 0) için kök tam olarak r = 0; Newton orada sıfırın altına
+    taşıyor, bu yüzden doğrudan dönülüyor (camber sıfır).
+    """
+    if xmc <= 0.0:
+        return 0.0
+
+    r = xmc + 0.05
+    for _ in range(max_iter):
+        s = math.sqrt(r / 3.0)
+        r_new = r - (r * (1.0 - s) - xmc) / (1.0 - 1.5 * s)
+        if r_new <= 0.0:
+            # sıfırın altına taşarsa yarıya indir (güvenlik; x_mc > 0)
+            r_new = 0.5 * r
+        if abs(r_new - r) < tol:
+            return r_new
+        r = r_new
+
+    raise ValueError(
+        f"Could not solve NACA 5-digit camber parameter r for x_mc={xmc:.3f}."
+    )
+
+
+@lru_cache(maxsize=16)
+def _r_for_P(P: int) -> float:
+    """
+    r for the P digit (x_mc = 0.05 * P). Cache key tamsayı P (0..9), float
+    x_mc değil; her P için Newton çözümü sadece bir kez yapılıyor.
     """
-    r_old = 0.1
-    diff = 1.0
-    it = 0
-    while diff > tol and it < max_iter:
-        r = xmc + r_old * math.sqrt(r_old / 3.0)
-        diff = abs(r - r_old)
-        r_old = r
-        it += 1
-    return r_old
+    return _compute_r_standard(0.05 * P)
 
 
+@lru_cache(maxsize=128)
 def _compute_k1_standard(L: int, r: float) -> float:
     """
     k1 for standard 5-digit camber line.
     C_li = 0.15 * L, and N(r) as in ITU notes. :contentReference[oaicite:2]{index=2}
     """
+    if r <= 0.0:
+        return 0.0   # P = 0: x < r bölgesi boş, arka kısım r**3 ile sıfır
+
     cli = 0.15 * L
     # N(r)
-    N = ((3 * r - 7 * r**2 + 8 * r**3 - 4 * r**4) / math.sqrt(r - r**2)
+    r2 = r * r
+    r3 = r2 * r
+    r4 = r2 * r2
+    N = ((3 * r - 7 * r2 + 8 * r3 - 4 * r4) / math.sqrt(r - r2)
          - 1.5 * (1 - 2 * r) * (math.pi / 2 - math.asin(1 - 2 * r)))
     k1 = 6.0 * cli / N
     return k1
 
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _naca5_core(k1, r, t, x, yt_unit):
+        """
+        Numba kernel: thickness, standard camber ve yüzeyler tek döngüde.
+        Chord ile ölçekleme çağıran tarafta yapılıyor.
+        """
+        n = x.size
+        yt = np.empty_like(x)
+        yc = np.empty_like(x)
+        xu = np.empty_like(x)
+        yu = np.empty_like(x)
+        xl = np.empty_like(x)
+        yl = np.empty_like(x)
+
+        k6 = k1 / 6.0
+        c0 = r * r * (3.0 - r)
+        aft = k1 * r * r * r / 6.0
+
+        for i in range(n):
+            xi = x[i]
+            x2 = xi * xi   # pow() yerine artımlı çarpım
+            x3 = x2 * xi
+            yt_i = t * yt_unit[i]
+
+            if xi < r:
+                yc_i = k6 * (x3 - 3.0 * r * x2 + c0 * xi)
+                dyc = k6 * (3.0 * x2 - 6.0 * r * xi + c0)
+            else:
+                yc_i = aft * (1.0 - xi)
+                dyc = -aft
+
+            # sin/cos(atan(y'_c)) trig'siz
+            cos_t = 1.0 / math.sqrt(dyc * dyc + 1.0)
+            sin_t = dyc * cos_t
+
+            yt[i] = yt_i
+            yc[i] = yc_i
+            xu[i] = xi - yt_i * sin_t
+            yu[i] = yc_i + yt_i * cos_t
+            xl[i] = xi + yt_i * sin_t
+            yl[i] = yc_i - yt_i * cos_t
+
+        return xu, yu, xl, yl, yc, yt
+else:
+    _naca5_core = None
+
+
 def generate_geometry(params: NACA5Params,
                       n_points: int = 200,
-                      spacing: str = "cosine"):
+                      spacing: str = "cosine",
+                      dtype=np.float32):
     """
     Generate NACA 5-digit airfoil geometry (standard camber Q=0 only).
 
@@ -74,6 +153,9 @@ def generate_geometry(params: NACA5Params,
         x_loop, y_loop : closed loop coordinates (upper TE->LE, lower LE->TE)
         x_c, y_c       : camber line coordinates
         x_raw, yt      : base x and thickness distribution (for analysis)
+
+    Arrays are float32 by default (plot/CAD için yeterli); pass
+    dtype=np.float64 for precision-sensitive downstream use.
     """
     if params.Q == 1:
         raise NotImplementedError(
@@ -82,58 +164,44 @@ def generate_geometry(params: NACA5Params,
 
     L, P, t, c = params.L, params.P, params.t, params.chord
 
-    # ---- x distribution ----
-    if spacing == "cosine":
-        beta = np.linspace(0.0, np.pi, n_points)
-        x = (1.0 - np.cos(beta)) / 2.0   # 0..1
-    elif spacing == "linear":
-        x = np.linspace(0.0, 1.0, n_points)
-    else:
-        raise ValueError("spacing must be 'cosine' or 'linear'.")
-
-    # ---- thickness distribution (same as 4-digit) ----
-    yt = 5 * t * (
-        0.2969 * np.sqrt(x)
-        - 0.1260 * x
-        - 0.3516 * x**2
-        + 0.2843 * x**3
-        - 0.1015 * x**4
-    )
+    # ---- x distribution (cached, read-only) ----
+    x, x2, x3, yt_unit = _x_grid(spacing, n_points, dtype)   # 0..1
 
     # ---- camber line (standard, Q=0) ----
-    xmc = 0.05 * P   # position of max camber
-    r = _compute_r_standard(xmc)
+    r = _r_for_P(P)   # x_mc = 0.05 * P (position of max camber)
     k1 = _compute_k1_standard(L, r)
 
-    yc = np.zeros_like(x)
-    dyc_dx = np.zeros_like(x)
-
-    for i, xi in enumerate(x):
-        if xi < r:
-            yc[i] = (k1 / 6.0) * (
-                xi**3 - 3 * r * xi**2 + r**2 * (3 - r) * xi
-            )
-            dyc_dx[i] = (k1 / 6.0) * (
-                3 * xi**2 - 6 * r * xi + r**2 * (3 - r)
-            )
-        else:
-            yc[i] = (k1 * r**3 / 6.0) * (1 - xi)
-            dyc_dx[i] = -(k1 * r**3 / 6.0)
-
-    theta = np.arctan(dyc_dx)
-
-    # upper / lower surfaces
-    xu = x - yt * np.sin(theta)
-    yu = yc + yt * np.cos(theta)
-    xl = x + yt * np.sin(theta)
-    yl = yc - yt * np.cos(theta)
+    if _naca5_core is not None:
+        # numba varsa tüm nümerik gövde native kod olarak çalışıyor
+        xu, yu, xl, yl, yc, yt = _naca5_core(k1, r, t, x, yt_unit)
+    else:
+        # ---- thickness distribution (same as 4-digit) ----
+        yt = t * yt_unit
+
+        k6 = k1 / 6.0
+        r2 = r * r
+        r3 = r2 * r
+        c0 = r2 * (3.0 - r)
+
+        # ön (x < r) kübik, arka kısım lineer; tek seferde maske ile
+        fwd = x < r
+        yc = np.where(
+            fwd,
+            k6 * (x3 - 3 * r * x2 + c0 * x),
+            (k1 * r3 / 6.0) * (1.0 - x),
+        )
+        dyc_dx = np.where(
+            fwd,
+            k6 * (3 * x2 - 6 * r * x + c0),
+            -(k1 * r3 / 6.0),
+        )
+
+        # upper / lower surfaces
+        xu, yu, xl, yl = _offset_surfaces(x, yc, yt, dyc_dx)
 
     # closed loop: upper TE->LE, lower LE->TE
-    x_loop = np.concatenate([xu[::-1], xl[1:]])
-    y_loop = np.concatenate([yu[::-1], yl[1:]])
-
     # scale chord only in x (y in chord units, t/c remains same)
-    x_loop *= c
+    x_loop, y_loop = _close_loop(xu, yu, xl, yl, c)
     x_c = x * c
 
     return x_loop, y_loop, x_c, yc, x, yt
@@ -148,13 +216,10 @@ def compute_metrics(params: NACA5Params,
     """
     Basic geometric metrics for NACA 5-digit.
     """
-    max_thickness = np.max(2 * yt) * params.chord
-    max_camber = np.max(np.abs(yc)) * params.chord
+    max_thickness = float(np.max(2 * yt)) * params.chord
+    max_camber = float(np.max(np.abs(yc))) * params.chord
 
-    area = 0.5 * np.abs(
-        np.dot(x_loop, np.roll(y_loop, -1))
-        - np.dot(y_loop, np.roll(x_loop, -1))
-    )
+    area = _shoelace(x_loop, y_loop)
 
     r_le = 1.1019 * (params.t ** 2) * params.chord
 
@@ -172,13 +237,17 @@ def compute_metrics(params: NACA5Params,
     }
 
 
+@_cached_result()
 def generate_naca5_full(code: str,
                         chord: float = 1.0,
                         n_points: int = 200,
-                        spacing: str = "cosine"):
+                        spacing: str = "cosine",
+                        dtype=np.float32):
     """
     Convenience: tek çağrıda hem geometriyi hem metrikleri döndürür.
 
+    Results are LRU-cached; returned arrays are read-only (.copy() if needed).
+
     Returns:
         x_loop, y_loop, x_c, yc, metrics_dict
     """
@@ -187,6 +256,7 @@ def generate_naca5_full(code: str,
         params,
         n_points=n_points,
         spacing=spacing,
+        dtype=dtype,
     )
     metrics = compute_metrics(params, x_loop, y_loop, x_raw, yc, yt)
     return x_loop, y_loop, x_c, yc, metrics
@@ -1,11 +1,14 @@
 # core/naca6.py
 
-from dataclasses import dataclass
+from typing import NamedTuple
 import numpy as np
 
+from ._common import (
+    _digits, _x_grid, _shoelace, _symmetric_geometry, _cached_result,
+)
 
-@dataclass
-class NACA6Params:
+
+class NACA6Params(NamedTuple):
     code: str              # e.g. "63-018" veya "65-415"
     pos_min_pressure: int  # ikinci rakam (x/c * 10)
     design_cl: float       # tasarım Cl
@@ -29,12 +32,13 @@ def parse_naca6(code: str, chord: float = 1.0) -> NACA6Params:
     """
     code = code.strip()
 
-    if len(code) != 6 or code[0] != "6" or code[2] != "-":
+    d = _digits(code[1] + code[3:]) if len(code) == 6 else None
+    if d is None or code[0] != "6" or code[2] != "-":
         raise ValueError("NACA 6-series format: e.g. '63-018', '65-415'.")
 
-    pos_min = int(code[1])
-    cl_digit = int(code[3])
-    t = int(code[4:]) / 100.0
+    pos_min = d[0]
+    cl_digit = d[1]
+    t = (d[2] * 10 + d[3]) / 100.0
 
     design_cl = cl_digit / 10.0
 
@@ -49,7 +53,8 @@ def parse_naca6(code: str, chord: float = 1.0) -> NACA6Params:
 
 def generate_geometry(params: NACA6Params,
                       n_points: int = 200,
-                      spacing: str = "cosine"):
+                      spacing: str = "cosine",
+                      dtype=np.float32):
     """
     Basitleştirilmiş NACA 6-serisi geometri üretimi.
 
@@ -60,44 +65,21 @@ def generate_geometry(params: NACA6Params,
 
     Bu, gerçek 6-seri laminar profilleriyle bire bir aynı DEĞİLDİR;
     ancak aynı t/c'ye sahip, simetrik, düzgün bir airfoil verir.
+
+    Diziler varsayılan olarak float32; hassas kullanım için
+    dtype=np.float64 verilebilir.
     """
     t = params.thickness
     c = params.chord
 
-    # ---- x dağılımı ----
-    if spacing == "cosine":
-        beta = np.linspace(0.0, np.pi, n_points)
-        x = (1.0 - np.cos(beta)) / 2.0   # 0..1
-    elif spacing == "linear":
-        x = np.linspace(0.0, 1.0, n_points)
-    else:
-        raise ValueError("spacing must be 'cosine' or 'linear'.")
+    # ---- x dağılımı (cache'li, read-only) ----
+    x, x2, x3, yt_unit = _x_grid(spacing, n_points, dtype)   # 0..1
 
     # ---- kalınlık dağılımı (4-digit 00xx formülü) ----
-    yt = 5 * t * (
-        0.2969 * np.sqrt(x)
-        - 0.1260 * x
-        - 0.3516 * x**2
-        + 0.2843 * x**3
-        - 0.1015 * x**4
-    )
-
-    yc = np.zeros_like(x)   # simetrik
-    # üst/alt yüzey
-    xu = x
-    yu = yt
-    xl = x
-    yl = -yt
+    yt = t * yt_unit
 
-    # kapalı loop
-    x_loop = np.concatenate([xu[::-1], xl[1:]])
-    y_loop = np.concatenate([yu[::-1], yl[1:]])
-
-    # chord ile ölçekle
-    x_loop *= c
-    x_c = x * c
-
-    return x_loop, y_loop, x_c, yc, x, yt
+    # simetrik: üst/alt yüzey x, ±yt; kapalı loop x chord ile ölçekli
+    return _symmetric_geometry(x, yt, c)
 
 
 def compute_metrics(params: NACA6Params,
@@ -106,13 +88,10 @@ def compute_metrics(params: NACA6Params,
                     x: np.ndarray,
                     yc: np.ndarray,
                     yt: np.ndarray):
-    max_thickness = np.max(2 * yt) * params.chord
-    max_camber = np.max(np.abs(yc)) * params.chord
+    max_thickness = float(np.max(2 * yt)) * params.chord
+    max_camber = float(np.max(np.abs(yc))) * params.chord
 
-    area = 0.5 * np.abs(
-        np.dot(x_loop, np.roll(y_loop, -1))
-        - np.dot(y_loop, np.roll(x_loop, -1))
-    )
+    area = _shoelace(x_loop, y_loop)
 
     r_le = 1.1019 * (params.thickness ** 2) * params.chord
 
@@ -129,15 +108,18 @@ def compute_metrics(params: NACA6Params,
     }
 
 
+@_cached_result()
 def generate_naca6_full(code: str,
                         chord: float = 1.0,
                         n_points: int = 200,
-                        spacing: str = "cosine"):
+                        spacing: str = "cosine",
+                        dtype=np.float32):
     params = parse_naca6(code, chord=chord)
     x_loop, y_loop, x_c, yc, x_raw, yt = generate_geometry(
         params,
         n_points=n_points,
         spacing=spacing,
+        dtype=dtype,
     )
     metrics = compute_metrics(params, x_loop, y_loop, x_raw, yc, yt)
     return x_loop, y_loop, x_c, yc, metrics
@@ -1,15 +1,14 @@
 # core/naca8.py
 
-from dataclasses import dataclass
 import numpy as np
-from .naca4 import generate_naca4_full
+from ._common import _cached_result
+from ._passthrough import (
+    NACAPassthroughParams,
+    parse_passthrough,
+    generate_naca_passthrough,
+)
 
-
-@dataclass
-class NACA8Params:
-    code: str
-    base4: str
-    chord: float = 1.0
+NACA8Params = NACAPassthroughParams
 
 
 def parse_naca8(code: str, chord: float = 1.0) -> NACA8Params:
@@ -20,34 +19,15 @@ def parse_naca8(code: str, chord: float = 1.0) -> NACA8Params:
     Örnek:
         8412 -> 4-digit eşleniği: 412  (7-serideki gibi)
     """
-    s = code.strip()
-    if len(s) < 4 or not s.isdigit():
-        raise ValueError("NACA 8-series: en az 4 haneli numeric kod bekleniyor, örn. '8412'.")
-
-    if s[0] != "8":
-        raise ValueError("NACA 8-series kodu 8 ile başlamalı.")
-
-    base4 = s[1:]
-    if len(base4) != 4:
-        raise ValueError("Şimdilik '8' + 4-digit formatı destekleniyor, örn. 8412, 8309 vb.")
-
-    return NACA8Params(code=s, base4=base4, chord=chord)
+    return parse_passthrough("8", code, chord=chord)
 
 
+@_cached_result()
 def generate_naca8_full(code: str,
                         chord: float = 1.0,
                         n_points: int = 200,
-                        spacing: str = "cosine"):
-    params = parse_naca8(code, chord=chord)
-    x_loop, y_loop, x_c, yc, metrics4 = generate_naca4_full(
-        params.base4,
-        chord=chord,
-        n_points=n_points,
-        spacing=spacing,
+                        spacing: str = "cosine",
+                        dtype=np.float32):
+    return generate_naca_passthrough(
+        "8", code, chord=chord, n_points=n_points, spacing=spacing, dtype=dtype
     )
-
-    metrics = dict(metrics4)
-    metrics["code"] = params.code
-    metrics["note"] = "Geometry generated using NACA 4-digit equivalent of 8-series code."
-
-    return x_loop, y_loop, x_c, yc, metrics
@@ -1,52 +1,535 @@
-from core.naca4 import generate_naca4_full
-from core.naca5 import generate_naca5_full
-from core.naca6 import generate_naca6_full
-from core.naca7 import generate_naca7_full
-from core.naca8 import generate_naca8_full
-
 import sys
+import importlib
+from collections import defaultdict, deque
+
+import numpy as np
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QFormLayout, QGroupBox, QLabel, QLineEdit, QPushButton,
     QSpinBox, QDoubleSpinBox, QCheckBox, QFileDialog,
-    QMessageBox, QTabWidget, QTabBar
+    QMessageBox, QTabWidget, QTabBar, QToolBar, QStyle
+)
+from PyQt5.QtCore import (
+    Qt, QSize, QTimer, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QOpenGLContext
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib import rcParams
+
+try:
+    import pyqtgraph as pg   # opsiyonel; varsa çizim pyqtgraph ile
+    _USE_PG = True
+except ImportError:
+    pg = None
+    _USE_PG = False
+
+
+# ---------- GEOMETRY DISPATCH ----------
+
+# x dağılımı: cosine spacing. Core, (spacing, n_points) başına x grid'ini
+# (cos, kuvvetler, birim kalınlık) LRU-cache'liyor; n_points spinbox'ı
+# değişmediği sürece her Generate aynı cache'li grid'i kullanıyor.
+_SPACING = "cosine"
+
+# Core varsayılanı float32; UI kanonik kopyayı (export) float64 istiyor,
+# çizim için ayrıca float32 projeksiyon tutuluyor.
+_DTYPE = np.float64
+
+# family tab label -> (core module, generator). Modüller ilk kullanımda
+# import ediliyor; pencere açılışı NACA modüllerini beklemiyor.
+_GENERATORS = {
+    "NACA 4-digit": ("core.naca4", "generate_naca4_full"),
+    "NACA 5-digit": ("core.naca5", "generate_naca5_full"),
+    "NACA 6-series": ("core.naca6", "generate_naca6_full"),
+    "NACA 7-series": ("core.naca7", "generate_naca7_full"),
+    "NACA 8-series": ("core.naca8", "generate_naca8_full"),
+}
+_RESOLVED = {}   # family -> resolved generator function
+
+
+def _resolve_generator(family: str):
+    gen = _RESOLVED.get(family)
+    if gen is None:
+        mod_name, fn_name = _GENERATORS[family]
+        gen = getattr(importlib.import_module(mod_name), fn_name)
+        _RESOLVED[family] = gen
+    return gen
+
+
+def _generate(family: str, code: str, chord: float, n_points: int, spacing: str):
+    """
+    Seçili aileye göre core generator'ı çağırır.
+
+    generate_naca*_full sonuçları core'da zaten (code, chord, n_points,
+    spacing, dtype) ile LRU-cache'li; aynı girdilerle tekrar Generate sadece cache
+    lookup. Burada ikinci bir cache tutulmuyor.
+
+    Returns:
+        x, y, x_c, yc, metrics_dict
+    """
+    return _resolve_generator(family)(
+        code, chord=chord, n_points=n_points, spacing=spacing, dtype=_DTYPE
+    )
+
+
+# ekranda çizgi başına hedef nokta sayısı (export her zaman tam çözünürlük)
+_DISPLAY_POINTS = 600
+
+
+def _decimate(xy: np.ndarray, full: bool = False) -> np.ndarray:
+    """
+    Sadece çizim için: (N, 2) [x, y] dizisini N // _DISPLAY_POINTS adımıyla
+    seyrelt, son nokta (TE kapanışı) her zaman korunuyor. full=True ise dizi
+    aynen dönüyor.
+    """
+    n = len(xy)
+    stride = 1 if full else max(1, n // _DISPLAY_POINTS)
+    if stride == 1:
+        return xy
+
+    idx = np.arange(0, n, stride)
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return xy[idx]
+
+
+_EXPORT_CHUNK = 512   # satır / blok
+
+
+def _write_coords(filename: str, xy: np.ndarray, delimiter: str, header: str):
+    """
+    (N, 2) [x, y] koordinatlarını _EXPORT_CHUNK satırlık bloklar halinde savetxt ile
+    yaz; 64 KiB buffer, her bloktan sonra flush (formatlama ile disk I/O
+    örtüşüyor).
+    """
+    with open(filename, "w", buffering=64 * 1024) as f:
+        f.write(header + "\n")
+        for i in range(0, len(xy), _EXPORT_CHUNK):
+            np.savetxt(
+                f, xy[i:i + _EXPORT_CHUNK],
+                fmt="%.6f", delimiter=delimiter,
+            )
+            f.flush()
+
+
+_ICON_CACHE = {}   # path -> QIcon (PNG'ler bir kez okunuyor)
+
+
+def _icon(path: str) -> QIcon:
+    ic = _ICON_CACHE.get(path)
+    if ic is None:
+        ic = QIcon(path)
+        _ICON_CACHE[path] = ic
+    return ic
+
+
+# ---------- BACKGROUND GENERATION ----------
+
+class _GenSignals(QObject):
+    finished = pyqtSignal(tuple)   # (x, y, x_c, yc, metrics)
+    error = pyqtSignal(str)
+
+
+class _GenWorker(QRunnable):
+    """Geometriyi QThreadPool'da üretir; UI thread'i bloklanmıyor."""
+
+    def __init__(self, family: str, code: str, chord: float, n_points: int,
+                 spacing: str = _SPACING):
+        super().__init__()
+        self.args = (family, code, chord, n_points, spacing)
+        self.signals = _GenSignals()
+
+    def run(self):
+        try:
+            result = _generate(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(tuple(result))
+
+
+class _JitWarmUp(QRunnable):
+    """
+    Arka planda seçili ailenin core modülünü import eder ve numba kernel'i
+    varsa (4/5-digit) bir kez çalıştırır, böylece ilk Generate import / JIT
+    derlemesini beklemiyor (cache=True ise diskten yükleniyor). Sadece
+    seçilen aile ısıtılıyor; kullanılmayan aileler hiç import edilmiyor.
+    """
+
+    # numba kernel'i olan aileler -> örnek kod
+    _SAMPLES = {"NACA 4-digit": "2412", "NACA 5-digit": "23012"}
 
+    def __init__(self, family: str):
+        super().__init__()
+        self.family = family
+
+    def run(self):
+        _resolve_generator(self.family)
+
+        code = self._SAMPLES.get(self.family)
+        if code is None:
+            return
+
+        from core import HAVE_NUMBA
+        if not HAVE_NUMBA:
+            return
+
+        try:
+            _generate(self.family, code, 1.0, 200, _SPACING)
+        except Exception:
+            pass
+
+
+# ---------- BACKGROUND EXPORT ----------
+
+class _ExportWorker(QThread):
+    """Export dosyasını UI thread'i dışında yazar."""
+
+    # QThread.finished ile çakışmasın diye farklı isim
+    exported = pyqtSignal(str)   # path
+    error = pyqtSignal(str)
+
+    def __init__(self, path: str, xy, delimiter: str, header: str, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.args = (xy, delimiter, header)
+
+    def run(self):
+        try:
+            _write_coords(self.path, *self.args)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.exported.emit(self.path)
+
+
+# ---------- PLOT CANVAS WIDGETS ----------
+#
+# Her iki canvas da aynı arayüzü sunuyor; ana pencere sadece bunları çağırıyor:
+#   make_toolbar(parent)                      -> toolbar widget'ı ya da None
+#   set_data(x, y, x_c, y_c, show_camber)     -> yeni profil (tam çizim)
+#   clear_data()                              -> boş görünüm
+#   set_view(show_camber, show_grid)          -> checkbox toggle'ları (ucuz yol)
+
+def _make_watermark(parent: QWidget) -> QLabel:
+    """
+    Çok hafif "WingsCAD" watermark'ı: plot Text'i yerine Qt overlay, böylece
+    tam çizimlerde glyph'ler hiç render edilmiyor. Boyutu parent'ın
+    resizeEvent'inde ayarlanıyor.
+    """
+    label = QLabel("WingsCAD", parent)
+    label.setAlignment(Qt.AlignCenter)
+    label.setAttribute(Qt.WA_TransparentForMouseEvents)
+    label.setStyleSheet(
+        "background: transparent;"
+        "color: rgba(255, 255, 255, 10);"
+        "font-size: 40pt;"
+        "font-weight: bold;"
+    )
+    return label
 
-# ---------- MATPLOTLIB CANVAS WIDGET ----------
 
 class MplCanvas(FigureCanvas):
-    def __init__(self, parent=None):
-        fig = Figure(tight_layout=True)
+    # kenar boşlukları font boyutu cinsinden (tick label + eksen etiketi / başlık)
+    _MARGINS_FS = dict(left=5.0, right=1.5, top=2.5, bottom=4.0)
+
+    def __init__(self, parent=None, show_grid: bool = True):
+        fig = Figure()
         fig.patch.set_facecolor("#181a1f")  # Qt arka planına yakın
         self.ax = fig.add_subplot(111)
         super().__init__(fig)
         self.setParent(parent)
 
+        # tight_layout her çizimde layout hesaplıyor; onun yerine sabit
+        # (point cinsinden) boşluklar, sadece resize'da yeniden hesaplanıyor
+        self._fit_margins()
+
+        self.watermark = _make_watermark(self)
+
+        self._setup_axes(show_grid)
+
+        # her tam çizimden sonra blit arka planını yenile (resize, zoom, pan...)
+        self.mpl_connect("draw_event", self._on_draw)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._fit_margins()
+        self.watermark.setGeometry(self.rect())
+
+    def _fit_margins(self):
+        """_MARGINS_FS boşluklarını (font.size * k pt) figure oranına çevir."""
+        w, h = self.figure.get_size_inches() * 72.0   # points
+        m = {k: v * rcParams["font.size"] for k, v in self._MARGINS_FS.items()}
+        if w <= m["left"] + m["right"] or h <= m["top"] + m["bottom"]:
+            return   # çok küçük; mevcut düzeni koru
+        self.figure.subplots_adjust(
+            left=m["left"] / w,
+            right=1.0 - m["right"] / w,
+            top=1.0 - m["top"] / h,
+            bottom=m["bottom"] / h,
+        )
+
+    def make_toolbar(self, parent):
+        return NavigationToolbar(self, parent)
+
+    def _setup_axes(self, show_grid: bool):
+        """
+        Eksen stili, etiketler ve kalıcı çizgiler bir kez; sonrasında sadece
+        çizgi verisi / grid / başlık değişiyor.
+        """
+        ax = self.ax
+
+        # koyu gri arka plan
+        ax.set_facecolor("#202225")
+
+        # grid
+        self._apply_grid(show_grid)
+
+        # eksen çerçevesi
+        for spine in ax.spines.values():
+            spine.set_edgecolor("#70757d")
+            spine.set_linewidth(1.0)
+
+        # tick & label renkleri
+        ax.tick_params(colors="#d0d4db")
+        ax.xaxis.label.set_color("#d0d4db")
+        ax.yaxis.label.set_color("#d0d4db")
+        ax.title.set_color("#f5f5f5")
+
+        ax.set_xlabel("x (chord)")
+        ax.set_ylabel("y")
+        ax.set_aspect("equal", adjustable="box")
+
+        # Kalıcı, animated çizgiler: tam çizimde arka plana girmiyor,
+        # checkbox toggle'larında sadece bunlar blit ediliyor.
+        self._airfoil_line, = ax.plot(
+            [], [], linewidth=1.8, color="#32a8ff", animated=True  # mavi profil
+        )
+        self._camber_line, = ax.plot(
+            [], [], linestyle="--", linewidth=1.0, color="#ff7373", animated=True  # kırmızı
+        )
+        self._bg = None
+
+    def _apply_grid(self, show_grid: bool):
+        self._grid_shown = show_grid
+        if show_grid:
+            self.ax.grid(
+                True,
+                color="#3a3f44",
+                linestyle="-",
+                linewidth=0.7
+            )
+        else:
+            self.ax.grid(False)
+
+    def _on_draw(self, event):
+        """Tam çizimden sonra: arka planı sakla, animated çizgileri üstüne çiz."""
+        # savefig de draw_event tetikliyor (SVG/PDF'te geçici canvas, PNG'de
+        # farklı dpi); ekran dışı çizimlerde blit arka planına dokunma
+        if event.canvas is not self or self.is_saving():
+            return
+        self._bg = self.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._airfoil_line)
+        self.ax.draw_artist(self._camber_line)
+
+    def _blit_lines(self):
+        """Sadece profil/camber çizgilerini saklı arka plan üzerine yeniden çiz."""
+        if self._bg is None:
+            self.draw_idle()
+            return
+
+        self.restore_region(self._bg)
+        self.ax.draw_artist(self._airfoil_line)
+        self.ax.draw_artist(self._camber_line)
+        self.blit(self.ax.bbox)
+
+    def clear_data(self):
+        """Boş görünüm: çizgileri temizle, varsayılan limitlere dön."""
+        self._airfoil_line.set_data([], [])
+        self._camber_line.set_data([], [])
+        self.ax.set_xlim(0.0, 1.0)
+        self.ax.set_ylim(0.0, 1.0)
+        self.ax.set_title("No airfoil generated yet")
+        self.draw_idle()
+
+    def set_data(self, x, y, x_c, y_c, show_camber: bool):
+        self._airfoil_line.set_data(x, y)
+        if x_c is not None:
+            self._camber_line.set_data(x_c, y_c)
+        self._camber_line.set_visible(show_camber)
+
+        # yeni veri -> limitler değişiyor, tam çizim gerekli (arka plan draw_event'te yenileniyor)
+        self.ax.relim()
+        self.ax.autoscale(enable=True)   # clear_data'daki sabit limitleri bırak
+        self.ax.set_title("Airfoil geometry")
+        self.draw_idle()
+
+    def set_view(self, show_camber: bool, show_grid: bool):
+        """Camber toggle sadece blit; grid arka planı değiştirdiği için tam çizim."""
+        self._camber_line.set_visible(show_camber)
+
+        if show_grid != self._grid_shown:
+            self._apply_grid(show_grid)
+            self.draw_idle()
+        else:
+            self._blit_lines()
+
+
+if _USE_PG:
+    class PgCanvas(pg.PlotWidget):
+        """
+        pyqtgraph tabanlı canvas (QPainter / OpenGL); büyük n_points'te
+        pan/zoom matplotlib'e göre çok daha akıcı. MplCanvas ile aynı arayüz.
+        """
+
+        # GraphicsView.__init__ içinden resizeEvent(None) çağrılıyor; o anda
+        # label henüz yok (PlotWidget.__getattr__ AttributeError veriyor)
+        watermark = None
+
+        def __init__(self, parent=None, show_grid: bool = True):
+            # GL context oluşturulamıyorsa (VM, uzak masaüstü...) pyqtgraph her
+            # paint'te hata veriyor; o durumda QPainter yolunda kal
+            pg.setConfigOptions(useOpenGL=QOpenGLContext().create(), antialias=True)
+            super().__init__(parent, background="#202225")
+
+            self.watermark = _make_watermark(self)
+            self.watermark.setGeometry(self.rect())
+
+            self.setAspectLocked(True)
+            for name in ("left", "bottom"):
+                axis = self.getAxis(name)
+                axis.setPen("#70757d")
+                axis.setTextPen("#d0d4db")
+            self.setLabel("bottom", "x (chord)")
+            self.setLabel("left", "y")
+
+            self.airfoil_curve = self.plot(pen=pg.mkPen("#32a8ff", width=2))  # mavi profil
+            self.camber_curve = self.plot(
+                pen=pg.mkPen("#ff7373", width=1, style=Qt.DashLine)        # kırmızı
+            )
+            self.showGrid(x=show_grid, y=show_grid, alpha=0.3)
+
+        def resizeEvent(self, event):
+            super().resizeEvent(event)
+            if self.watermark is not None:
+                self.watermark.setGeometry(self.rect())
+
+        def make_toolbar(self, parent):
+            """
+            NavigationToolbar karşılığı: pan/zoom mouse ile yapılıyor, toolbar'da
+            sadece Home (otomatik ölçek) ve Save figure (PNG / SVG) var.
+            """
+            toolbar = QToolBar(parent)
+            toolbar.setIconSize(QSize(18, 18))
+            style = self.style()
+            toolbar.addAction(
+                style.standardIcon(QStyle.SP_DirHomeIcon), "Home", self.enableAutoRange
+            ).setToolTip("Reset original view")
+            toolbar.addAction(
+                style.standardIcon(QStyle.SP_DialogSaveButton), "Save", self.save_figure
+            ).setToolTip("Save the figure")
+            return toolbar
+
+        def save_figure(self):
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Save the figure", "airfoil.png",
+                "PNG image (*.png);;SVG image (*.svg)",
+            )
+            if not path:
+                return
+
+            import pyqtgraph.exporters as exporters   # sadece kaydederken gerekli
+            if path.lower().endswith(".svg"):
+                exporter = exporters.SVGExporter(self.plotItem)
+            else:
+                exporter = exporters.ImageExporter(self.plotItem)
+            try:
+                exporter.export(path)
+            except Exception as e:
+                QMessageBox.critical(self, "Error saving file", str(e))
+
+        def clear_data(self):
+            self.airfoil_curve.setData([], [])
+            self.camber_curve.setData([], [])
+            self.setTitle("No airfoil generated yet", color="#f5f5f5")
+
+        def set_data(self, x, y, x_c, y_c, show_camber: bool):
+            self.airfoil_curve.setData(x, y)
+            if x_c is not None:
+                self.camber_curve.setData(x_c, y_c)
+            self.camber_curve.setVisible(show_camber)
+            self.setTitle("Airfoil geometry", color="#f5f5f5")
+            self.enableAutoRange()
+
+        def set_view(self, show_camber: bool, show_grid: bool):
+            self.camber_curve.setVisible(show_camber)
+            self.showGrid(x=show_grid, y=show_grid, alpha=0.3)
+else:
+    PgCanvas = None
+
 
 # ---------- MAIN WINDOW ----------
 
 class WingsCADMainWindow(QMainWindow):
+    # family tab label -> code placeholder (tab sırası da buradan)
+    _PLACEHOLDERS = {
+        "NACA 4-digit": "e.g. 2412",
+        "NACA 5-digit": "e.g. 23012",
+        "NACA 6-series": "e.g. 63-018",
+        "NACA 7-series": "7xxx",
+        "NACA 8-series": "8xxx",
+    }
+
+    # Properties paneli; eksik metrik anahtarları 0.0 (defaultdict(float))
+    _PROPS_TEMPLATE = (
+        "Code: {code}\n"
+        "Chord: {chord:.3f}\n"
+        "m (max camber): {m:.3f}\n"
+        "p (camber pos.): {p:.3f}\n"
+        "t (thickness): {t:.3f}\n"
+        "Max thickness: {max_thickness:.4f}\n"
+        "Max camber (abs): {max_camber:.4f}\n"
+        "Area: {area:.4f}\n"
+        "LE radius: {leading_edge_radius:.4f}"
+    )
+
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("WingsCAD – Airfoil Designer")
-        self.setWindowIcon(QIcon("assets/icons/wingscad.png"))
+        self.setWindowIcon(_icon("assets/icons/wingscad.png"))
         self.resize(1400, 800)
 
-        self.current_airfoil = None  # (x, y)
-        self.current_camber = None   # (x_c, y_c)
+        self.current_airfoil = None  # (N, 2) C-contiguous [x, y]
+        self.current_camber = None   # (N, 2) C-contiguous [x_c, y_c]
+        self._display_xy = None      # float32 kopyalar, sadece çizim için
+        self._display_camber = None
         self.current_family = "NACA 4-digit"
 
+        self._gen_worker = None      # çalışan _GenWorker (referans tutmak için)
+        self._gen_request = None     # (family, code, chord) of the running job
+        self._export_worker = None   # çalışan _ExportWorker
+        self._msg = None             # paylaşılan QMessageBox (ilk kullanımda)
+        self._msg_queue = deque()    # kutu açıkken gelen mesajlar
+
+        # checkbox toggle'larını ~1 frame (16 ms) içinde tek redraw'a topla;
+        # start() zaten çalışan timer'ı yeniden başlatıyor
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._refresh_view)
+
         self._init_ui()
 
+        # event loop başlayınca (pencere gösterildikten sonra) varsayılan
+        # aile; diğerleri sekmeleri ilk seçildiğinde
+        self._warmed = set()
+        QTimer.singleShot(0, self._warm_up_jit)
+
     # ------ UI CONSTRUCTION ------
 
     def _init_ui(self):
@@ -85,11 +568,8 @@ class WingsCADMainWindow(QMainWindow):
         family_v = QVBoxLayout(family_group)
 
         self.family_tabbar = QTabBar()
-        self.family_tabbar.addTab("NACA 4-digit")
-        self.family_tabbar.addTab("NACA 5-digit")
-        self.family_tabbar.addTab("NACA 6-series")
-        self.family_tabbar.addTab("NACA 7-series")
-        self.family_tabbar.addTab("NACA 8-series")
+        for family in self._PLACEHOLDERS:
+            self.family_tabbar.addTab(family)
         self.family_tabbar.setExpanding(False)
         self.family_tabbar.setCurrentIndex(0)
         self.family_tabbar.currentChanged.connect(self._on_family_tab_changed)
@@ -102,7 +582,7 @@ class WingsCADMainWindow(QMainWindow):
         params_form = QFormLayout(params_group)
 
         self.naca_code_edit = QLineEdit()
-        self.naca_code_edit.setPlaceholderText("e.g. 2412")
+        self.naca_code_edit.setPlaceholderText(self._PLACEHOLDERS[self.current_family])
         params_form.addRow("Code:", self.naca_code_edit)
 
         self.chord_spin = QDoubleSpinBox()
@@ -124,38 +604,17 @@ class WingsCADMainWindow(QMainWindow):
         actions_v = QVBoxLayout(actions_group)
 
         self.generate_btn = QPushButton("Generate")
-        self.generate_btn.setIcon(QIcon("assets/icons/generate.png"))
+        self.generate_btn.setIcon(_icon("assets/icons/generate.png"))
         self.generate_btn.setIconSize(QSize(18, 18))
         self.generate_btn.clicked.connect(self._on_generate_clicked)
         self.generate_btn.setMinimumWidth(120)
-        self.generate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1f6feb;
-                color: white;
-                font-weight: bold;
-                padding: 6px 10px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1158c7;
-            }
-        """)
+        self.generate_btn.setProperty("class", "primary")   # stil: main() QSS
 
         self.reset_btn = QPushButton("Reset")
-        self.reset_btn.setIcon(QIcon("assets/icons/reset.png"))
+        self.reset_btn.setIcon(_icon("assets/icons/reset.png"))
         self.reset_btn.setIconSize(QSize(18, 18))
         self.reset_btn.clicked.connect(self._on_reset_clicked)
-        self.reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e5534b;
-                color: white;
-                padding: 6px 10px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #c93c35;
-            }
-        """)
+        self.reset_btn.setProperty("class", "danger")
 
         actions_v.addWidget(self.generate_btn)
         actions_v.addWidget(self.reset_btn)
@@ -167,28 +626,17 @@ class WingsCADMainWindow(QMainWindow):
         export_v = QVBoxLayout(export_group)
 
         self.export_dat_btn = QPushButton(".dat (Selig)")
-        self.export_dat_btn.setIcon(QIcon("assets/icons/export_dat.png"))
+        self.export_dat_btn.setIcon(_icon("assets/icons/export_dat.png"))
         self.export_dat_btn.setIconSize(QSize(18, 18))
         self.export_dat_btn.clicked.connect(self._export_dat)
 
         self.export_csv_btn = QPushButton(".csv (x,y)")
-        self.export_csv_btn.setIcon(QIcon("assets/icons/export_csv.png"))
+        self.export_csv_btn.setIcon(_icon("assets/icons/export_csv.png"))
         self.export_csv_btn.setIconSize(QSize(18, 18))
         self.export_csv_btn.clicked.connect(self._export_csv)
 
-        export_style = """
-            QPushButton {
-                background-color: #3b3f46;
-                color: #f5f5f5;
-                padding: 4px 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #4a4f57;
-            }
-        """
-        self.export_dat_btn.setStyleSheet(export_style)
-        self.export_csv_btn.setStyleSheet(export_style)
+        self.export_dat_btn.setProperty("class", "export")
+        self.export_csv_btn.setProperty("class", "export")
 
         export_v.addWidget(self.export_dat_btn)
         export_v.addWidget(self.export_csv_btn)
@@ -201,14 +649,20 @@ class WingsCADMainWindow(QMainWindow):
 
         self.show_camber_checkbox = QCheckBox("Show camber line")
         self.show_camber_checkbox.setChecked(True)
-        self.show_camber_checkbox.stateChanged.connect(self._update_plot)
+        self.show_camber_checkbox.stateChanged.connect(self._schedule_redraw)
 
         self.grid_checkbox = QCheckBox("Show grid")
         self.grid_checkbox.setChecked(True)
-        self.grid_checkbox.stateChanged.connect(self._update_plot)
+        self.grid_checkbox.stateChanged.connect(self._schedule_redraw)
+
+        # kapalıyken büyük n_points çizim için seyreltiliyor
+        self.full_res_checkbox = QCheckBox("Full-resolution plot")
+        self.full_res_checkbox.setChecked(False)
+        self.full_res_checkbox.stateChanged.connect(self._update_plot)
 
         view_v.addWidget(self.show_camber_checkbox)
         view_v.addWidget(self.grid_checkbox)
+        view_v.addWidget(self.full_res_checkbox)
         view_v.addStretch()
         naca_layout.addWidget(view_group)
 
@@ -227,98 +681,78 @@ class WingsCADMainWindow(QMainWindow):
     # ---------- PLOT AREA ----------
 
     def _build_plot_area(self, layout: QVBoxLayout):
-        self.canvas = MplCanvas(self)
-        self.toolbar = NavigationToolbar(self.canvas, self)
+        canvas_cls = PgCanvas if _USE_PG else MplCanvas
+        self.canvas = canvas_cls(self, show_grid=self.grid_checkbox.isChecked())
+        self.toolbar = self.canvas.make_toolbar(self)
 
-        layout.addWidget(self.toolbar)
+        if self.toolbar is not None:
+            layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas, 1)
 
         self._init_plot()
 
     # ------ PLOT LOGIC ------
 
-    def _style_axes(self, ax):
-        """Tek yerden eksen / grid stilini ayarla."""
-        # koyu gri arka plan
-        ax.set_facecolor("#202225")
-
-        # grid
-        if self.grid_checkbox.isChecked():
-            ax.grid(
-                True,
-                color="#3a3f44",
-                linestyle="-",
-                linewidth=0.7
-            )
-        else:
-            ax.grid(False)
-
-        # eksen çerçevesi
-        for spine in ax.spines.values():
-            spine.set_edgecolor("#70757d")
-            spine.set_linewidth(1.0)
-
-        # tick & label renkleri
-        ax.tick_params(colors="#d0d4db")
-        ax.xaxis.label.set_color("#d0d4db")
-        ax.yaxis.label.set_color("#d0d4db")
-        ax.title.set_color("#f5f5f5")
-
-        # watermark (çok hafif)
-        ax.text(
-            0.5, 0.5, "WingsCAD",
-            transform=ax.transAxes,
-            ha="center",
-            va="center",
-            fontsize=40,
-            color="#ffffff",
-            alpha=0.04,
-            weight="bold",
-        )
-
     def _init_plot(self):
-        ax = self.canvas.ax
-        ax.clear()
-        self._style_axes(ax)
-        ax.set_title("No airfoil generated yet")
-        ax.set_xlabel("x (chord)")
-        ax.set_ylabel("y")
-        ax.set_aspect("equal", adjustable="box")
-        self.canvas.draw_idle()
+        self.canvas.clear_data()
 
-    def _update_plot(self):
-        ax = self.canvas.ax
-        ax.clear()
+    def _camber_visible(self) -> bool:
+        return self.current_camber is not None and self.show_camber_checkbox.isChecked()
 
+    def _update_plot(self):
         if self.current_airfoil is None:
             # Hiç profil yoksa sadece stil + watermark göster
-            self._style_axes(ax)
-            ax.set_title("No airfoil generated yet")
-            ax.set_xlabel("x (chord)")
-            ax.set_ylabel("y")
-            ax.set_aspect("equal", adjustable="box")
-            self.canvas.draw_idle()
+            self._init_plot()
             return
 
-        x, y = self.current_airfoil
-
-        # Stil
-        self._style_axes(ax)
+        full = self.full_res_checkbox.isChecked()
 
         # ---- AIRFOIL ----
-        ax.plot(x, y, linewidth=1.8, color="#32a8ff")  # mavi profil
+        xy = _decimate(self._display_xy, full)
+        x, y = xy[:, 0], xy[:, 1]
 
         # ---- CAMBER LINE ----
-        if self.current_camber is not None and self.show_camber_checkbox.isChecked():
-            x_c, y_c = self.current_camber
-            ax.plot(x_c, y_c, linestyle="--", linewidth=1.0, color="#ff7373")  # kırmızı
+        x_c = y_c = None
+        if self._display_camber is not None:
+            xy_c = _decimate(self._display_camber, full)
+            x_c, y_c = xy_c[:, 0], xy_c[:, 1]
 
-        ax.set_xlabel("x (chord)")
-        ax.set_ylabel("y")
-        ax.set_aspect("equal", adjustable="box")
-        ax.set_title("Airfoil geometry")
+        self.canvas.set_data(x, y, x_c, y_c, self._camber_visible())
+
+    def _schedule_redraw(self, *_):
+        # stateChanged(int) doğrudan QTimer.start'a bağlanırsa start(msec)
+        # overload'u çağrılıyor; argümanı yut
+        self._redraw_timer.start()
+
+    def _refresh_view(self):
+        """View checkbox'ları: canvas'ın ucuz güncelleme yolu (mpl: blit)."""
+        self.canvas.set_view(self._camber_visible(), self.grid_checkbox.isChecked())
 
-        self.canvas.draw_idle()
+    def _warm_up_jit(self):
+        fam = self.current_family
+        if fam in self._warmed or fam not in _GENERATORS:
+            return
+        self._warmed.add(fam)
+        QThreadPool.globalInstance().start(_JitWarmUp(fam))
+
+    def _msg_box(self, title: str, text: str, icon=QMessageBox.Warning):
+        """Tek, yeniden kullanılan modal mesaj kutusu (her seferinde yeni dialog yok).
+
+        Kutu zaten açıksa (ör. worker hatası exec_() sırasında geldi) mesaj
+        kuyruğa ekleniyor; açık olan kapanınca sırayla gösteriliyor.
+        exec_() yeniden girilmiyor, açık mesajın metni de ezilmiyor.
+        """
+        self._msg_queue.append((title, text, icon))
+        if self._msg is None:
+            self._msg = QMessageBox(self)
+        elif self._msg.isVisible():
+            return
+        while self._msg_queue:
+            title, text, icon = self._msg_queue.popleft()
+            self._msg.setIcon(icon)
+            self._msg.setWindowTitle(title)
+            self._msg.setText(text)
+            self._msg.exec_()
 
     # ------ SIGNAL HANDLERS ------
 
@@ -326,16 +760,8 @@ class WingsCADMainWindow(QMainWindow):
         text = self.family_tabbar.tabText(index)
         self.current_family = text
 
-        if text == "NACA 4-digit":
-            self.naca_code_edit.setPlaceholderText("e.g. 2412")
-        elif text == "NACA 5-digit":
-            self.naca_code_edit.setPlaceholderText("e.g. 23012")
-        elif text == "NACA 6-series":
-            self.naca_code_edit.setPlaceholderText("e.g. 63-018")
-        elif text == "NACA 7-series":
-            self.naca_code_edit.setPlaceholderText("7xxx")
-        elif text == "NACA 8-series":
-            self.naca_code_edit.setPlaceholderText("8xxx")
+        self.naca_code_edit.setPlaceholderText(self._PLACEHOLDERS.get(text, ""))
+        self._warm_up_jit()
 
         self.statusBar().showMessage(f"{text} selected", 3000)
 
@@ -345,88 +771,137 @@ class WingsCADMainWindow(QMainWindow):
         n_points = int(self.n_points_spin.value())
 
         if not code:
-            QMessageBox.information(
-                self,
+            self._msg_box(
                 "Missing code",
-                "Please enter an airfoil code (e.g. 2412, 23012, 63-018...)."
+                "Please enter an airfoil code (e.g. 2412, 23012, 63-018...).",
+                QMessageBox.Information,
             )
             return
 
-        try:
-            fam = self.current_family
-            if fam == "NACA 4-digit":
-                x, y, x_c, yc, metrics = generate_naca4_full(
-                    code, chord=chord, n_points=n_points, spacing="cosine"
-                )
-            elif fam == "NACA 5-digit":
-                x, y, x_c, yc, metrics = generate_naca5_full(
-                    code, chord=chord, n_points=n_points, spacing="cosine"
-                )
-            elif fam == "NACA 6-series":
-                x, y, x_c, yc, metrics = generate_naca6_full(
-                    code, chord=chord, n_points=n_points, spacing="cosine"
-                )
-            elif fam == "NACA 7-series":
-                x, y, x_c, yc, metrics = generate_naca7_full(
-                    code, chord=chord, n_points=n_points, spacing="cosine"
-                )
-            elif fam == "NACA 8-series":
-                x, y, x_c, yc, metrics = generate_naca8_full(
-                    code, chord=chord, n_points=n_points, spacing="cosine"
-                )
-            else:
-                QMessageBox.information(
-                    self,
-                    "Not implemented",
-                    f"{fam} not implemented in core."
-                )
-                return
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to generate airfoil:\n{e}")
+        fam = self.current_family
+        if fam not in _GENERATORS:
+            self._msg_box(
+                "Not implemented",
+                f"{fam} not implemented in core.",
+                QMessageBox.Information,
+            )
+            return
+
+        worker = _GenWorker(fam, code, chord, n_points, _SPACING)
+        worker.signals.finished.connect(self._on_generation_ready)
+        worker.signals.error.connect(self._on_generation_failed)
+        self._gen_worker = worker
+        self._gen_request = (fam, code, chord)
+
+        self.generate_btn.setEnabled(False)
+        self.statusBar().showMessage(f"Generating {fam} {code}...")
+        QThreadPool.globalInstance().start(worker)
+
+    def _is_stale_generation(self) -> bool:
+        """
+        Sinyal bekleyen _GenWorker'dan mı geliyor? Reset (ya da sonrasında
+        yeni bir Generate) eski işin sonucunu/hatasını geçersiz kılıyor.
+        """
+        worker = self._gen_worker
+        return worker is None or self.sender() is not worker.signals
+
+    def _on_generation_failed(self, message: str):
+        if self._is_stale_generation():
             return
+        self._gen_worker = None
+        self.generate_btn.setEnabled(True)
+        self.statusBar().clearMessage()
+        self._msg_box("Error", f"Failed to generate airfoil:\n{message}")
 
-        self.current_airfoil = (x, y)
-        self.current_camber = (x_c, yc)
+    def _on_generation_ready(self, result: tuple):
+        if self._is_stale_generation():
+            return
+        self._gen_worker = None
+        self.generate_btn.setEnabled(True)
+
+        fam, code, chord = self._gen_request
+        x, y, x_c, yc, metrics = result
+
+        # tek (N, 2) blok: export'ta column_stack kopyası yok
+        self.current_airfoil = np.stack([x, y], axis=1)
+        self.current_camber = np.stack([x_c, yc], axis=1)
+        self._display_xy = self.current_airfoil.astype(np.float32)
+        self._display_camber = self.current_camber.astype(np.float32)
 
         # Properties text (metrics dict’i varsa)
         if isinstance(metrics, dict):
-            props_text = (
-                f"Code: {metrics.get('code', code)}\n"
-                f"Chord: {metrics.get('chord', chord):.3f}\n"
-                f"m (max camber): {metrics.get('m', 0.0):.3f}\n"
-                f"p (camber pos.): {metrics.get('p', 0.0):.3f}\n"
-                f"t (thickness): {metrics.get('t', 0.0):.3f}\n"
-                f"Max thickness: {metrics.get('max_thickness', 0.0):.4f}\n"
-                f"Max camber (abs): {metrics.get('max_camber', 0.0):.4f}\n"
-                f"Area: {metrics.get('area', 0.0):.4f}\n"
-                f"LE radius: {metrics.get('leading_edge_radius', 0.0):.4f}"
-            )
+            values = defaultdict(float, code=code, chord=chord)
+            values.update(metrics)
+            props_text = self._PROPS_TEMPLATE.format_map(values)
         else:
-            props_text = f"{self.current_family}\nCode: {code}\nChord: {chord:.3f}"
+            props_text = f"{fam}\nCode: {code}\nChord: {chord:.3f}"
 
         self.properties_label.setText(props_text)
 
         self.statusBar().showMessage(
-            f"Generated {self.current_family} {code} with {len(x)} points (chord={chord})",
+            f"Generated {fam} {code} with {len(x)} points (chord={chord})",
             5000
         )
         self._update_plot()
 
     def _on_reset_clicked(self):
+        # çalışan iş iptal edilemiyor; sonucu gelince düşülüyor
+        self._gen_worker = None
+        self._gen_request = None
+        self.generate_btn.setEnabled(True)
+
         self.naca_code_edit.clear()
         self.chord_spin.setValue(1.0)
         self.n_points_spin.setValue(200)
         self.current_airfoil = None
         self.current_camber = None
+        self._display_xy = None
+        self._display_camber = None
         self.properties_label.setText("No airfoil generated yet.")
         self._init_plot()
         self.statusBar().showMessage("Parameters reset", 3000)
 
     # ------ EXPORT FUNCTIONS ------
 
+    def _start_export(self, ext: str, filename: str, delimiter: str, header: str):
+        worker = _ExportWorker(filename, self.current_airfoil, delimiter, header, self)
+        worker.exported.connect(
+            lambda path: self._on_export_done(ext, path)
+        )
+        worker.error.connect(
+            lambda msg: self._on_export_failed(ext, msg)
+        )
+        worker.finished.connect(worker.deleteLater)
+        self._export_worker = worker
+
+        self.export_dat_btn.setEnabled(False)
+        self.export_csv_btn.setEnabled(False)
+        worker.start()
+
+    def _on_export_finished(self):
+        self._export_worker = None
+        self.export_dat_btn.setEnabled(True)
+        self.export_csv_btn.setEnabled(True)
+
+    def _on_export_done(self, ext: str, path: str):
+        self._on_export_finished()
+        self.statusBar().showMessage(f"Exported {ext} to {path}", 5000)
+
+    def _on_export_failed(self, ext: str, message: str):
+        self._on_export_finished()
+        self._msg_box("Error", f"Failed to export {ext}:\n{message}")
+
+    def closeEvent(self, event):
+        # _ExportWorker'lar pencerenin child'ı; çalışırken yok edilirlerse Qt
+        # süreci abort ediyor ("Destroyed while thread is still running").
+        # Yazılan dosya yarım kalmasın diye bitmelerini bekle.
+        for worker in self.findChildren(_ExportWorker):
+            worker.wait()
+        super().closeEvent(event)
+
     def _export_dat(self):
         if self.current_airfoil is None:
-            QMessageBox.information(self, "No data", "There is no airfoil to export.")
+            self._msg_box("No data", "There is no airfoil to export.", QMessageBox.Information)
             return
 
         filename, _ = QFileDialog.getSaveFileName(
@@ -435,22 +910,11 @@ class WingsCADMainWindow(QMainWindow):
         if not filename:
             return
 
-        x, y = self.current_airfoil
-
-        try:
-            with open(filename, "w") as f:
-                f.write("Generated by WingsCAD\n")
-                for xi, yi in zip(x, y):
-                    f.write(f"{xi:.6f} {yi:.6f}\n")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to export .dat:\n{e}")
-            return
-
-        self.statusBar().showMessage(f"Exported .dat to {filename}", 5000)
+        self._start_export(".dat", filename, " ", "Generated by WingsCAD")
 
     def _export_csv(self):
         if self.current_airfoil is None:
-            QMessageBox.information(self, "No data", "There is no airfoil to export.")
+            self._msg_box("No data", "There is no airfoil to export.", QMessageBox.Information)
             return
 
         filename, _ = QFileDialog.getSaveFileName(
@@ -459,18 +923,7 @@ class WingsCADMainWindow(QMainWindow):
         if not filename:
             return
 
-        x, y = self.current_airfoil
-
-        try:
-            with open(filename, "w") as f:
-                f.write("x,y\n")
-                for xi, yi in zip(x, y):
-                    f.write(f"{xi:.6f},{yi:.6f}\n")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to export .csv:\n{e}")
-            return
-
-        self.statusBar().showMessage(f"Exported .csv to {filename}", 5000)
+        self._start_export(".csv", filename, ",", "x,y")
 
 
 # ---------- ENTRY POINT ----------
@@ -519,6 +972,34 @@ def main():
         QCheckBox {
             spacing: 4px;
         }
+        QPushButton[class="primary"] {
+            background-color: #1f6feb;
+            color: white;
+            font-weight: bold;
+            padding: 6px 10px;
+            border-radius: 4px;
+        }
+        QPushButton[class="primary"]:hover {
+            background-color: #1158c7;
+        }
+        QPushButton[class="danger"] {
+            background-color: #e5534b;
+            color: white;
+            padding: 6px 10px;
+            border-radius: 4px;
+        }
+        QPushButton[class="danger"]:hover {
+            background-color: #c93c35;
+        }
+        QPushButton[class="export"] {
+            background-color: #3b3f46;
+            color: #f5f5f5;
+            padding: 4px 8px;
+            border-radius: 4px;
+        }
+        QPushButton[class="export"]:hover {
+            background-color: #4a4f57;
+        }
     """)
 
     window = WingsCADMainWindow()